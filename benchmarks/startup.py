@@ -0,0 +1,89 @@
+'''measure web process startup cost of the working tree against a baseline git revision
+
+usage: python benchmarks/startup.py [--ref REV] [--runs N]
+
+the baseline defaults to the revision before this benchmark was added, few runs are mostly
+noise so the default is 50'''
+import argparse
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['celery', 'ffmpeg', 'billiard', 'webplayer.metadata']
+
+# the baseline built the app, its engines and the task module on import
+BEFORE = '''
+import webplayer.webplayer
+'''
+
+AFTER = '''
+from webplayer.webplayer import create_app
+app = create_app()
+'''
+
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+exec(compile({code!r}, '<startup>', 'exec'))
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(m for m in {heavy!r} if m in sys.modules))
+'''
+
+
+def _git(*args):
+    return subprocess.run(['git', '-C', ROOT, *args], check=True, capture_output=True).stdout
+
+
+def default_ref():
+    '''parent of the commit that added this benchmark'''
+    added = _git('log', '--diff-filter=A', '--format=%H', '--', 'benchmarks/startup.py')
+    return added.decode().split()[-1] + '^'
+
+
+def export(ref, target):
+    '''extract the tree of a git revision into a directory'''
+    with tarfile.open(fileobj=io.BytesIO(_git('archive', '--format=tar', ref))) as archive:
+        archive.extractall(target)
+
+
+def measure(code, source, runs):
+    '''run the startup code in fresh interpreters, return timings and loaded heavy modules'''
+    timings = []
+    loaded = ''
+    env = dict(os.environ,
+            PYTHONPATH=os.pathsep.join(filter(None, [source, os.environ.get('PYTHONPATH')])))
+    for _ in range(runs):
+        # run in a scratch directory so database files never land in the repository
+        with tempfile.TemporaryDirectory() as scratch:
+            out = subprocess.run([sys.executable, '-c', PROBE.format(code=code, heavy=HEAVY_MODULES)],
+                    check=True, capture_output=True, text=True, cwd=scratch, env=env).stdout.split()
+        timings.append(float(out[0]))
+        loaded = out[1] if len(out) > 1 else ''
+    return timings, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ref', help='baseline git revision')
+    parser.add_argument('--runs', type=int, default=50, help='fresh interpreters per case')
+    args = parser.parse_args()
+    ref = args.ref or default_ref()
+
+    with tempfile.TemporaryDirectory() as baseline:
+        export(ref, baseline)
+        print(f'{args.runs} fresh interpreters per case, baseline {ref}')
+        for label, code, source in (('before (baseline)', BEFORE, baseline),
+                ('after (create_app)', AFTER, ROOT)):
+            timings, loaded = measure(code, source, args.runs)
+            print(f'{label:20} median {statistics.median(timings) * 1000:8.1f} ms'
+                    f'  min {min(timings) * 1000:8.1f} ms  heavy modules: {loaded or "none"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ from collections import namedtuple
 from flask import Blueprint, request, abort, jsonify
 from flask_cors import CORS, cross_origin
 from webplayer.dbaccess import GenericRepo
+from webplayer.repos import process_repo
 
 mod = Blueprint('bookmark_handler', __name__, url_prefix='/bookmark')
 cors = CORS(mod)
@@ -16,7 +17,7 @@ class BookmarkRepo(GenericRepo):
 
 
 def _get_repo():
-    return BookmarkRepo(mod.config.get('DB_FILE'))
+    return process_repo(BookmarkRepo)
 
 
 def _is_after(mark_a, mark_b):
@@ -33,12 +34,6 @@ def _save_bookmark(repo, entry, overwrite=False):
     return jsonify(repo.get(entry.id)._asdict()), 409
 
 
-@mod.record_once
-def pass_config(state):
-    '''configure bookmark module with app config'''
-    mod.config = state.app.config.copy()
-
-
 @mod.route('/', methods=['POST'])
 @cross_origin()
 def create_bookmark():
@@ -3,6 +3,7 @@ from collections import namedtuple
 from flask import Blueprint, request, abort, jsonify
 from flask_cors import CORS, cross_origin
 from webplayer.dbaccess import GenericRepo
+from webplayer.repos import process_repo
 
 mod = Blueprint('config_handler', __name__, url_prefix='/config')
 cors = CORS(mod)
@@ -16,11 +17,8 @@ class ConfigRepo(GenericRepo):
         super().__init__(dbfile, 'configs', Config)
 
 
-@mod.record_once
-def pass_config(state):
-    '''configure config module with app config'''
-    mod.config = state.app.config.copy()
-    mod.repo = ConfigRepo(mod.config.get('DB_FILE'))
+def _get_repo():
+    return process_repo(ConfigRepo)
 
 
 @mod.route('/', methods=['POST'])
@@ -28,15 +26,16 @@ def pass_config(state):
 def create_config():
     '''put a new config for a specific album'''
     body = request.json
-    mod.repo.put(Config(**body))
+    repo = _get_repo()
+    repo.put(Config(**body))
 
-    return jsonify(mod.repo.get(body['id'])._asdict())
+    return jsonify(repo.get(body['id'])._asdict())
 
 
 @mod.route('/<idx>', methods=['GET'])
 def get_bookmark(idx):
     '''get a specific config'''
-    config = mod.repo.get(idx)
+    config = _get_repo().get(idx)
     if config:
         return jsonify(config._asdict())
 
@@ -47,5 +46,5 @@ def get_bookmark(idx):
 @cross_origin()
 def delete_config(idx):
     '''delete a specific playlist'''
-    mod.repo.delete(idx)
+    _get_repo().delete(idx)
     return ''
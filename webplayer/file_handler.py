@@ -4,11 +4,12 @@ import hashlib
 from typing import List
 
 from collections import namedtuple
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, current_app
 from flask_cors import CORS, cross_origin
 from webplayer.dbaccess import GenericRepo
+from webplayer.repos import process_repo
 from webplayer.bookmarks import BookmarkRepo
-from webplayer.metadata import async_enrichment
+from webplayer.tasks import enqueue_enrichment
 
 mod = Blueprint('file_handler', __name__, url_prefix='/file')
 cors = CORS(mod)
@@ -36,17 +37,20 @@ class Scanner:
     '''scanner service, looking for audio files on local drive'''
     audio = ['.mp3', '.ogg', '.m4a']
 
-    def __init__(self, directory_repo, bookmark_repo):
+    def __init__(self, directory_repo, bookmark_repo, base_path, base_url, db_file):
         self.cache = directory_repo
         self.bookmark_repo = bookmark_repo
+        self.base_path = base_path
+        self.base_url = base_url
+        self.db_file = db_file
 
     def scan(self, path=None, url=None, force_enrichment=False):
         '''scan local drive looking for audio files, provide base url to serve them from'''
-        path = path or mod.config.get('BASE_PATH', os.path.expanduser('~'))
-        url = url or mod.config.get('BASE_URL', '/')
+        path = path or self.base_path
+        url = url or self.base_url
 
         self._scan(path, url)
-        async_enrichment.delay('file', mod.config.get('DB_FILE'), force=force_enrichment)
+        enqueue_enrichment('file', self.db_file, force_enrichment)
         return [self._map_to_dto(d) for d in self.cache.list()]
 
     def albums(self):
@@ -133,32 +137,32 @@ class Scanner:
         return hashlib.md5(path.encode('utf-8')).hexdigest()
 
 
-@mod.record_once
-def pass_config(state):
-    '''copy config from main app'''
-    mod.config = state.app.config.copy()
-    mod.scanner = Scanner(DirectoryRepo(mod.config.get('DB_FILE')),
-            BookmarkRepo(mod.config.get('DB_FILE')))
+def _get_scanner():
+    config = current_app.config
+    return Scanner(process_repo(DirectoryRepo), process_repo(BookmarkRepo),
+            config.get('BASE_PATH', os.path.expanduser('~')), config.get('BASE_URL', '/'),
+            config.get('DB_FILE'))
+
 
 @mod.route('/scan')
 def scan():
     '''scan default directories'''
     return jsonify([d._asdict()
-        for d in mod.scanner.scan(force_enrichment=request.args.get('force', False, bool))])
+        for d in _get_scanner().scan(force_enrichment=request.args.get('force', False, bool))])
 
 
 @mod.route('/')
 @cross_origin()
 def albums():
     '''return the already scanned directory entries'''
-    return jsonify([d._asdict() for d in mod.scanner.albums()])
+    return jsonify([d._asdict() for d in _get_scanner().albums()])
 
 
 @mod.route('/book/')
 @cross_origin()
 def books():
     '''return the already scanned directory entries'''
-    return jsonify([d._asdict() for d in mod.scanner.books()])
+    return jsonify([d._asdict() for d in _get_scanner().books()])
 
 
 @mod.route('/<idx>', methods=['GET'])
@@ -166,7 +170,7 @@ def books():
 @cross_origin()
 def get_directory(idx):
     '''return a specific directory playlist'''
-    return jsonify(mod.scanner.directory(idx)._asdict())
+    return jsonify(_get_scanner().directory(idx)._asdict())
 
 
 @mod.route('/<idx>', methods=['DELETE'])
@@ -174,7 +178,7 @@ def get_directory(idx):
 @cross_origin()
 def delete_directory(idx):
     '''delete a specific cached directory playlist'''
-    mod.scanner.clear(idx)
+    _get_scanner().clear(idx)
     return ''
 
 
@@ -183,4 +187,4 @@ def delete_directory(idx):
 @cross_origin()
 def get_directory_files(idx):
     '''return a specific directory playlist'''
-    return jsonify(mod.scanner.directory_files(idx))
+    return jsonify(_get_scanner().directory_files(idx))
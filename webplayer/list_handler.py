@@ -3,11 +3,12 @@ from collections import namedtuple
 from typing import List
 import yaml
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_cors import CORS, cross_origin
 from webplayer.dbaccess import GenericRepo
+from webplayer.repos import process_repo
 from webplayer.bookmarks import BookmarkRepo
-from webplayer.metadata import async_enrichment
+from webplayer.tasks import enqueue_enrichment
 
 mod = Blueprint('list_handler', __name__, url_prefix='/list')
 cors = CORS(mod)
@@ -29,6 +30,14 @@ class ListRepo(GenericRepo):
         return self._query('is_book', 1)
 
 
+def _get_repo():
+    return process_repo(ListRepo)
+
+
+def _get_bookmark_repo():
+    return process_repo(BookmarkRepo)
+
+
 def _previous_files(repo, key):
     old_list = repo.get(key)
     if old_list:
@@ -52,12 +61,12 @@ def load_podcasts(repo, podcast_file, force_enrichment=False):
             entry = ListEntry(key, key, sorted(old_files + new_files, key=lambda e: e['name']), True)
             repo.put(entry)
 
-    async_enrichment.delay('list', mod.config.get('DB_FILE'), force=force_enrichment)
+    enqueue_enrichment('list', current_app.config.get('DB_FILE'), force_enrichment)
 
 
 def _map_to_dto(entry: ListEntry) -> ListDto:
     try:
-        bookmark = mod.bookmark_repo.get(entry.id)._asdict()
+        bookmark = _get_bookmark_repo().get(entry.id)._asdict()
     except (AttributeError, ValueError) as _:
         bookmark = {}
 
@@ -82,24 +91,16 @@ def _locate_bookmark(bookmark, files) -> int:
     return -1
 
 
-@mod.record_once
-def pass_config(state):
-    '''copy config from main app'''
-    mod.config = state.app.config.copy()
-    mod.repo = ListRepo(mod.config.get('DB_FILE'))
-    mod.bookmark_repo = BookmarkRepo(mod.config.get('DB_FILE'))
-
-
 @mod.route('/book/', methods=['GET'])
 def podcasts():
     '''return the book/podcast entries'''
-    return jsonify([_map_to_dto(d)._asdict() for d in mod.repo.books()])
+    return jsonify([_map_to_dto(d)._asdict() for d in _get_repo().books()])
 
 
 @mod.route('/book/refresh', methods=['GET'])
 def podcast_refresh():
     '''return the book/podcast entries'''
-    load_podcasts(mod.repo, mod.config.get('PODCAST_FILE'),
+    load_podcasts(_get_repo(), current_app.config.get('PODCAST_FILE'),
         force_enrichment=request.args.get('force', False, bool))
     return jsonify({'message': 'OK'})
 
@@ -107,7 +108,7 @@ def podcast_refresh():
 @mod.route('/', methods=['GET'])
 def lists():
     '''return the list entries'''
-    return jsonify([_map_to_dto(d)._asdict() for d in mod.repo.lists()])
+    return jsonify([_map_to_dto(d)._asdict() for d in _get_repo().lists()])
 
 
 @mod.route('/', methods=['POST'])
@@ -115,7 +116,7 @@ def create_list():
     '''create a new list entry'''
     body = request.json
     body['is_book'] = False
-    mod.repo.put(ListEntry(**body))
+    _get_repo().put(ListEntry(**body))
     return ''
 
 
@@ -127,7 +128,7 @@ def put_list(idx):
     list_dict['id'] = idx
     list_dict['is_book'] = False
     entry = ListEntry(**list_dict)
-    mod.repo.put(entry)
+    _get_repo().put(entry)
     return ''
 
 
@@ -136,14 +137,14 @@ def put_list(idx):
 @cross_origin()
 def get_list(idx):
     '''return a specific playlist'''
-    return jsonify(_map_to_dto(mod.repo.get(idx))._asdict())
+    return jsonify(_map_to_dto(_get_repo().get(idx))._asdict())
 
 
 @mod.route('/<idx>', methods=['DELETE'])
 @cross_origin()
 def delete_list(idx):
     '''delete a specific playlist'''
-    mod.repo.delete(idx)
+    _get_repo().delete(idx)
     return ''
 
 
@@ -152,4 +153,4 @@ def delete_list(idx):
 @cross_origin()
 def get_list_files(idx):
     '''return file list from a specific playlist'''
-    return jsonify(mod.repo.get(idx).files)
+    return jsonify(_get_repo().get(idx).files)
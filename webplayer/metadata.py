@@ -1,10 +1,10 @@
 import time
-import ffmpeg
-from billiard.pool import Pool
 from webplayer.celery import celery_app
 
 
 def get_chapters(file_name):
+    import ffmpeg  # pylint: disable=import-outside-toplevel
+
     try:
         probe = ffmpeg.probe(file_name, show_chapters=None)
 
@@ -29,6 +29,8 @@ def reset_chapter_info(list_entry):
 
 
 def enrich_with_chapters(repo, force=False):
+    from billiard.pool import Pool  # pylint: disable=import-outside-toplevel
+
     start = time.time_ns()
     all_lists = repo.list()
     with Pool(30) as pool:
@@ -0,0 +1,34 @@
+'''per-app, per-process repository cache for the web layer'''
+import os
+import threading
+from flask import current_app
+
+_lock = threading.Lock()
+
+
+def _reset_lock():
+    global _lock  # pylint: disable=global-statement
+    _lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    # a lock held by another thread at fork time would never be released in the child
+    os.register_at_fork(after_in_child=_reset_lock)
+
+
+def process_repo(repo_type):
+    '''return the current app's repository owned by this process, creating it on first use
+
+    engines inherited over fork are disposed without closing the parent's connections'''
+    with _lock:
+        cache = current_app.extensions.get('webplayer_repos')
+        if cache is None or cache['pid'] != os.getpid():
+            for repo in (cache or {}).get('repos', {}).values():
+                repo.engine.dispose(close=False)
+            cache = {'pid': os.getpid(), 'repos': {}}
+            current_app.extensions['webplayer_repos'] = cache
+
+        repos = cache['repos']
+        if repo_type not in repos:
+            repos[repo_type] = repo_type(current_app.config.get('DB_FILE'))
+        return repos[repo_type]
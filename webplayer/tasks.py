@@ -0,0 +1,9 @@
+'''entry point for background work requested by the web process'''
+
+
+def enqueue_enrichment(repo_type, db_file, force=False):
+    '''queue chapter enrichment for a repository type on the celery worker
+
+    the task module pulls in celery, so it is only imported once work is actually requested'''
+    from webplayer.metadata import async_enrichment  # pylint: disable=import-outside-toplevel
+    async_enrichment.delay(repo_type, db_file, force=force)
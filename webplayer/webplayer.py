@@ -5,12 +5,30 @@ from webplayer.bookmarks import mod as mod_bookmarks
 from webplayer.list_handler import mod as mod_list_handler
 from webplayer.config import mod as mod_config_handler
 
-app = Flask(__name__, instance_relative_config=True)
 
-app.config.from_object('webplayer.default_settings')
-app.config.from_pyfile('webplayer.cfg', silent=True)
+def create_app(config_object='webplayer.default_settings'):
+    '''create the flask app, database engines are opened lazily in each serving process'''
+    app = Flask(__name__, instance_relative_config=True)
 
-app.register_blueprint(mod_file_handler)
-app.register_blueprint(mod_bookmarks)
-app.register_blueprint(mod_list_handler)
-app.register_blueprint(mod_config_handler)
+    app.config.from_object(config_object)
+    app.config.from_pyfile('webplayer.cfg', silent=True)
+
+    app.register_blueprint(mod_file_handler)
+    app.register_blueprint(mod_bookmarks)
+    app.register_blueprint(mod_list_handler)
+    app.register_blueprint(mod_config_handler)
+
+    return app
+
+
+_app = None
+
+
+def __getattr__(name):
+    '''keep `from webplayer.webplayer import app` working, built once on first access'''
+    global _app  # pylint: disable=global-statement
+    if name == 'app':
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')